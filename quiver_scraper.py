@@ -1,59 +1,94 @@
 import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 import pandas as pd
 import numpy as np
-from bs4 import BeautifulSoup
+import lxml.etree
+import lxml.html
 import yfinance as yf
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+TRADE_COLUMNS = ["Politician", "Stock", "Trade Type", "Trade Date", "Amount", "Sector"]
+CATEGORY_COLUMNS = ["Politician", "Trade Type", "Sector"]
+VOLATILE_SECTORS = {"Technology", "Healthcare", "Energy"}
+
+_SYMBOL_CACHE = OrderedDict()
+_SYMBOL_CACHE_MAX = 2048
+_SYMBOL_CACHE_LOCK = Lock()
+
+def _lookup_symbol(token):
+    with _SYMBOL_CACHE_LOCK:
+        symbol = _SYMBOL_CACHE.get(token)
+        if symbol:
+            _SYMBOL_CACHE.move_to_end(token)
+            return symbol
+
+    symbol = yf.Ticker(token).info.get("symbol")
+    # Only cache real symbols: a throttled yfinance returns {} and should be retried next fetch.
+    if symbol:
+        with _SYMBOL_CACHE_LOCK:
+            _SYMBOL_CACHE[token] = symbol
+            _SYMBOL_CACHE.move_to_end(token)
+            if len(_SYMBOL_CACHE) > _SYMBOL_CACHE_MAX:
+                _SYMBOL_CACHE.popitem(last=False)
+    return symbol
+
+def _safe_symbol(token):
+    try:
+        return _lookup_symbol(token) or None
+    except Exception:
+        return None
 
 def fetch_quiver_trades():
     url = "https://www.quiverquant.com/congresstrading"
-    headers = {"User-Agent": "Mozilla/5.0"}
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.text, "html.parser")
+    response = _SESSION.get(url)
+    try:
+        tree = lxml.html.fromstring(response.content)
+    except lxml.etree.ParserError:
+        return pd.DataFrame()
 
-    trades = []
-    table = soup.find("table")
-    if not table:
+    tables = tree.xpath("//table")
+    if not tables:
         return pd.DataFrame()
 
-    rows = table.find_all("tr")[1:]
-    for row in rows:
-        cols = row.find_all("td")
-        if len(cols) >= 6:
-            trade = {
-                "Politician": cols[0].get_text(strip=True),
-                "Stock": cols[1].get_text(strip=True),
-                "Trade Type": cols[2].get_text(strip=True),
-                "Trade Date": cols[3].get_text(strip=True),
-                "Amount": cols[4].get_text(strip=True),
-                "Sector": cols[5].get_text(strip=True),
-            }
-            trades.append(trade)
-
-    df = pd.DataFrame(trades)
-
-    def resolve_ticker(name):
-        try:
-            ticker = yf.Ticker(name.split()[0]).info.get("symbol")
-            return ticker if ticker else name
-        except:
-            return name
-
-    df["Resolved Ticker"] = df["Stock"].apply(resolve_ticker)
-
-    def compute_suspicious_score(row):
-        score = 0.0
-        if "$15,000" in row["Amount"]:
-            score += 0.3
-        elif "$50,000" in row["Amount"]:
-            score += 0.5
-        elif "$100,000" in row["Amount"]:
-            score += 0.7
-
-        volatile_sectors = ["Technology", "Healthcare", "Energy"]
-        if row["Sector"] in volatile_sectors:
-            score += 0.2
-
-        return min(score, 1.0)
-
-    df["Suspicious Score"] = df.apply(compute_suspicious_score, axis=1)
+    # Skip the header row and any row without six real cells (notes, colspan rows).
+    cells = (row.xpath(".//td") for row in tables[0].xpath(".//tr")[1:])
+    trades = [["".join(t.strip() for t in td.itertext()) for td in cols[:6]] for cols in cells if len(cols) >= 6]
+    df = pd.DataFrame(trades, columns=TRADE_COLUMNS)
+
+    tokens = df["Stock"].str.split().str[0]
+    unique_tokens = tokens.dropna().unique()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        symbols = dict(zip(unique_tokens, executor.map(_safe_symbol, unique_tokens)))
+    df["Resolved Ticker"] = tokens.map(symbols).fillna(df["Stock"])
+
+    df = df.astype({col: "category" for col in CATEGORY_COLUMNS})
+
+    amount = df["Amount"]
+    score = np.select(
+        [
+            amount.str.contains("$15,000", regex=False),
+            amount.str.contains("$50,000", regex=False),
+            amount.str.contains("$100,000", regex=False),
+        ],
+        [0.3, 0.5, 0.7],
+        default=0.0,
+    )
+
+    # One bonus per sector category; the trailing 0.0 catches code -1 (missing sector).
+    sectors = df["Sector"].cat
+    sector_bonus = np.array([0.2 if s in VOLATILE_SECTORS else 0.0 for s in sectors.categories] + [0.0])
+    score += sector_bonus[sectors.codes.values]
+
+    df["Suspicious Score"] = np.minimum(score, 1.0).astype(np.float32)
     return df
@@ -1,27 +1,36 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import urllib.parse
 
 from quiver_scraper import fetch_quiver_trades
 
-df = fetch_quiver_trades()
-df["Trade Date"] = pd.to_datetime(df["Trade Date"], errors="coerce")
+DISPLAY_COLUMNS = ["Politician", "Resolved Ticker", "Stock", "Trade Type", "Trade Date", "Amount", "Sector", "Suspicious Score"]
+
+@st.cache_data(ttl=600, show_spinner=False)
+def load_trades():
+    df = fetch_quiver_trades()
+    df["Trade Date"] = pd.to_datetime(df["Trade Date"], errors="coerce")
+    return df
+
+df = load_trades()
 
 st.title("Suspicious Congressional Trade Tracker")
 
 # Filters
-sectors = df["Sector"].dropna().unique()
+sectors = df["Sector"].cat.categories
 selected_sector = st.selectbox("Filter by Sector", ["All"] + sorted(sectors.tolist()))
-if selected_sector != "All":
-    df = df[df["Sector"] == selected_sector]
-
 min_score = st.slider("Minimum Suspicious Score", 0.0, 1.0, 0.5)
-df = df[df["Suspicious Score"] >= min_score]
+
+mask = df["Suspicious Score"].values >= np.float32(min_score)
+if selected_sector != "All":
+    mask &= df["Sector"].values == selected_sector
+df = df.loc[mask, DISPLAY_COLUMNS]
 
 # Charts
 st.subheader("Trade Volume by Politician")
-trade_counts = df["Politician"].value_counts().reset_index()
+trade_counts = df["Politician"].cat.remove_unused_categories().value_counts().reset_index()
 trade_counts.columns = ["Politician", "Trade Count"]
 st.plotly_chart(px.bar(trade_counts, x="Politician", y="Trade Count", title="Number of Trades per Politician"))
 
@@ -31,20 +40,25 @@ st.plotly_chart(px.histogram(df, x="Suspicious Score", nbins=10, title="Distribu
 # Data Table
 st.subheader("Trade Data")
 
-def create_news_link(row):
+def create_news_links(df):
     base = "https://www.google.com/search?q="
-    query = f"{row['Resolved Ticker']} {row['Trade Date']} news"
-    return f"[🔎 News]({base + urllib.parse.quote_plus(query)})"
+    pairs = df[["Resolved Ticker", "Trade Date"]].drop_duplicates()
+    links = []
+    for ticker, trade_date in pairs.itertuples(index=False):
+        query = f"{ticker} {trade_date} news"
+        links.append(f"[🔎 News]({base + urllib.parse.quote_plus(query)})")
+    pairs["News"] = links
+    return df[["Resolved Ticker", "Trade Date"]].merge(pairs, on=["Resolved Ticker", "Trade Date"], how="left")["News"].set_axis(df.index)
 
-df["News"] = df.apply(create_news_link, axis=1)
+df = df.sort_values("Suspicious Score", ascending=False, kind="stable", ignore_index=True)
+df["News"] = create_news_links(df)
 
-display_df = df[["Politician", "Resolved Ticker", "Stock", "Trade Type", "Trade Date", "Amount", "Sector", "Suspicious Score", "News"]]
-st.dataframe(display_df, use_container_width=True)
+st.dataframe(df, use_container_width=True)
 
 # Download Button
 st.download_button(
     label="Download Filtered Data as CSV",
-    data=display_df.to_csv(index=False),
+    data=df.to_csv(index=False),
     file_name='filtered_trades.csv',
     mime='text/csv',
 )